@@ -1,43 +1,101 @@
-from typing import List, Optional, Tuple
-from dataclasses import dataclass
-from collections import deque
-
-from utils import Coordinate, Direction, GameState, Color, MirrorAngle, Shape
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from enum import Enum
+from functools import cached_property
+import heapq
+import multiprocessing
+import os
+
+from utils import (
+    Coordinate,
+    Direction,
+    GameState,
+    Color,
+    MirrorAngle,
+    Shape,
+    StateCodec,
+    EMPTY_CELL,
+    decode_chip,
+    decode_mirror,
+    encode_chip,
+)
+from move_tables import MoveTables, UNREACHABLE, get_reflected_direction
+
+# Maximum number of states remembered by the IDA* search between two iterations
+IDA_STAR_TABLE_SIZE = 1_000_000
+
+# Minimum number of subtrees given to each process by the parallel search
+PARALLEL_TASKS_PER_PROCESS = 4
+
+# Number of expansions between two checks of the cancellation of a parallel search task
+PARALLEL_CANCELLATION_INTERVAL = 1024
 
 
 @dataclass(frozen=True)
 class ResolutionState:
-    pawns: List[Coordinate]
+    state: int
+    """
+    The positions of the pawns packed into a single integer (see `StateCodec`).
+    """
+
     cost: int
-    previous_state: Optional["ResolutionState"] = None
+
+    codec: StateCodec = field(compare=False, repr=False)
+
+    parents: Dict[int, Optional[int]] = field(
+        default_factory=dict, compare=False, repr=False
+    )
+    """
+    The parent of every packed state reached by the search, `None` for the initial state.
+    Shared by all the states of a search so that the chain of moves can be rebuilt on demand.
+    """
 
     def __lt__(self, other: "ResolutionState") -> bool:
         return self.cost < other.cost
 
+    @cached_property
+    def pawns(self) -> List[Coordinate]:
+        """
+        The positions of the pawns, decoded from the packed state.
+        """
+        return self.codec.decode(self.state)
+
+    @property
+    def previous_state(self) -> Optional["ResolutionState"]:
+        """
+        The state preceding this one in the search, decoded from the parents table.
+        """
+        parent = self.parents.get(self.state)
+        if parent is None:
+            return None
+        return ResolutionState(parent, self.cost - 1, self.codec, self.parents)
+
     def get_move_sequence(self) -> List[Tuple[Color, Coordinate]]:
         """
         Reconstruct the sequence of moves from the state chain.
         :return: A list of moves in the format.
         """
         moves = []
-        current = self
-        while current.previous_state is not None:
+        current = self.state
+        parent = self.parents.get(current)
+        while parent is not None:
             # Find what changed between current and previous state
-            for pawn_color, (curr_pos, prev_pos) in enumerate(
-                zip(current.pawns, current.previous_state.pawns)
+            for pawn_color, (curr_cell, prev_cell) in enumerate(
+                zip(self.codec.get_cells(current), self.codec.get_cells(parent))
             ):
-                if curr_pos != prev_pos:
-                    moves.append((Color(pawn_color), curr_pos))
+                if curr_cell != prev_cell:
+                    moves.append((Color(pawn_color), self.codec.decode_cell(curr_cell)))
                     break
-            current = current.previous_state
+            current, parent = parent, self.parents.get(parent)
         return list(reversed(moves))
 
     def __str__(self):
         pawn_moved = None
 
-        if self.previous_state:
+        previous_state = self.previous_state
+        if previous_state:
             for i, (curr_pos, prev_pos) in enumerate(
-                zip(self.pawns, self.previous_state.pawns)
+                zip(self.pawns, previous_state.pawns)
             ):
                 if curr_pos != prev_pos:
                     pawn_moved = i
@@ -57,6 +115,137 @@ class ResolutionState:
         return string
 
 
+def solve_all_targets(
+    state: GameState, max_cost: Optional[int] = None
+) -> Dict[Tuple[Color, Shape], Optional[List[Tuple[Color, Coordinate]]]]:
+    """
+    Find an optimal solution for every chip target of a board with a single breadth-first search.
+    The search records the first state where each pawn stops on each chip of its color.
+    :param state: The game state, its current target is ignored.
+    :param max_cost: The maximum number of moves of the solutions, unlimited if None.
+    :return: The moves of the solution of each (color, shape) target, None for the targets not solved.
+    """
+    codec = StateCodec(state.board_size, len(state.pawns))
+    tables = MoveTables(state)
+
+    # Target reached by each pawn on each cell, if any
+    targets: Dict[Tuple[int, int], Tuple[Color, Shape]] = {}
+    for x, y, value in state.chips.items():
+        color, shape = decode_chip(value)
+        if color is not None and color.value < len(state.pawns):
+            targets[(color.value, codec.encode_cell(Coordinate(x=x, y=y)))] = (
+                color,
+                shape,
+            )
+    solutions: Dict[Tuple[Color, Shape], Optional[List[Tuple[Color, Coordinate]]]] = {
+        target: None for target in targets.values()
+    }
+    remaining = len(targets)
+
+    initial_state = codec.encode(state.pawns)
+    parents: Dict[int, Optional[int]] = {initial_state: None}
+    frontier = [initial_state]
+    cost = 0
+    while frontier and remaining:
+        # Record the targets reached for the first time
+        for packed in frontier:
+            for pawn, cell in enumerate(codec.get_cells(packed)):
+                target = targets.get((pawn, cell))
+                if target is not None and solutions[target] is None:
+                    solutions[target] = ResolutionState(
+                        packed, cost, codec, parents
+                    ).get_move_sequence()
+                    remaining -= 1
+
+        if max_cost is not None and cost >= max_cost:
+            break
+
+        next_frontier = []
+        for packed in frontier:
+            cells = codec.get_cells(packed)
+            for pawn, cell in enumerate(cells):
+                for direction in range(4):
+                    destination = tables.get_destination(pawn, cell, direction, cells)
+                    new_state = codec.set_cell(packed, pawn, destination)
+                    if new_state in parents:
+                        continue
+                    parents[new_state] = packed
+                    next_frontier.append(new_state)
+        frontier = next_frontier
+        cost += 1
+
+    return solutions
+
+
+# State of the processes of the parallel search, set once when each process starts
+_worker_player: Optional["AIPlayer"] = None
+_worker_best_cost = None
+
+
+def _init_parallel_worker(player: "AIPlayer", best_cost) -> None:
+    """
+    Initialize a process of the parallel search.
+    :param player: The player holding the state and tables of the board.
+    :param best_cost: The shared lowest cost of the solutions found by all the processes.
+    """
+    global _worker_player, _worker_best_cost
+    _worker_player = player
+    _worker_best_cost = best_cost
+
+
+def _search_parallel_subtree(task: Tuple[int, int]) -> Optional[List[int]]:
+    """
+    Search the cheapest solution of a subtree with a breadth-first search.
+    The search stops as soon as it can't find a solution cheaper than the best one found by any process.
+    :param task: The packed root state of the subtree and its cost.
+    :return: The states from the root to the solution, None if no cheaper solution is found.
+    """
+    player = _worker_player
+    root_state, root_cost = task
+    parents: Dict[int, Optional[int]] = {root_state: None}
+    visited = {player.get_state_key(root_state)}
+    frontier = [root_state]
+    cost = root_cost
+    # Local copy of the shared best cost, refreshed periodically to avoid locking on each state
+    best_cost = _worker_best_cost.value
+    expansions = 0
+
+    while frontier:
+        for state in frontier:
+            if player._is_solution(state):
+                with _worker_best_cost.get_lock():
+                    if cost >= _worker_best_cost.value:
+                        return None
+                    _worker_best_cost.value = cost
+                path = [state]
+                while parents[path[-1]] is not None:
+                    path.append(parents[path[-1]])
+                return list(reversed(path))
+
+        next_frontier = []
+        for state in frontier:
+            if expansions % PARALLEL_CANCELLATION_INTERVAL == 0:
+                best_cost = _worker_best_cost.value
+            expansions += 1
+            # The next layer can't hold a solution cheaper than the best one found
+            if cost + 1 >= best_cost:
+                return None
+
+            for new_state in player._compute_next_states(state):
+                if cost + 1 + player._get_heuristic(new_state) >= best_cost:
+                    continue
+                state_key = player.get_state_key(new_state)
+                if state_key in visited:
+                    continue
+                visited.add(state_key)
+                parents[new_state] = state
+                next_frontier.append(new_state)
+        frontier = next_frontier
+        cost += 1
+
+    return None
+
+
 def get_color_name(color_code: Color):
     # Define color names for pawns
     colors = ["red", "green", "blue", "yellow"]
@@ -69,11 +258,89 @@ def get_shape(shape_code: Shape):
     return shapes[shape_code.value]
 
 
+class SearchStrategy(Enum):
+    BFS = 0
+    """
+    Breadth-first search, expanding the states by increasing number of moves.
+    """
+
+    A_STAR = 1
+    """
+    A* search guided by the distance of the target pawn to the target.
+    """
+
+    IDA_STAR = 2
+    """
+    Iterative deepening A* search, using less memory than A*.
+    """
+
+    BIDIRECTIONAL = 3
+    """
+    Forward breadth-first search meeting backward searches of the target pawn from the target.
+    """
+
+    PARALLEL = 4
+    """
+    Breadth-first searches of the subtrees of the first moves, run by a pool of processes.
+    """
+
+    def __str__(self):
+        return self.name.lower()
+
+
 class AIPlayer:
-    def __init__(self, state: "GameState"):
+    def __init__(
+        self,
+        state: "GameState",
+        strategy: SearchStrategy = SearchStrategy.BFS,
+        processes: Optional[int] = None,
+    ):
+        """
+        :param state: The game state to solve.
+        :param strategy: The search strategy used by `solve`.
+        :param processes: The number of processes used by the parallel search, the number of CPUs by default.
+        """
         self.name = "AI"
         self.state = state
-        self.visited_positions = [[coords] for coords in self.state.pawns]
+        self.strategy = strategy
+        self.processes = processes or os.cpu_count() or 1
+
+        # Non-target pawns whose color has no mirror on the board behave exactly the same,
+        # so their positions can be compared as an unordered set when deduplicating states.
+        target_pawn_color = self.state.current_target[0]
+        mirror_colors = {
+            decode_mirror(value)[0]
+            for _, _, value in self.state.mirrors.items()
+            if value != EMPTY_CELL
+        }
+        self.interchangeable_pawns = [
+            i
+            for i in range(len(self.state.pawns))
+            if i != target_pawn_color.value and Color(i) not in mirror_colors
+        ]
+        self.codec = StateCodec(self.state.board_size, len(self.state.pawns))
+        self.tables = MoveTables(self.state)
+        self.target_cell = self.codec.encode_cell(
+            self.get_chip_coordinates(*self.state.current_target)
+        )
+        # Lower bound of the number of moves of the target pawn, used by the informed searches
+        self.target_distances = self.tables.get_distance_map(
+            target_pawn_color.value, self.target_cell
+        )
+
+    def get_state_key(self, state: int) -> int:
+        """
+        Get the canonical key of a packed pawns configuration, used to detect already explored states.
+        Pawns that can be swapped without changing the outcome of the search share the same key.
+        :param state: The packed state.
+        :return: The packed state with the interchangeable pawns sorted by cell.
+        """
+        if len(self.interchangeable_pawns) < 2:
+            return state
+        cells = sorted(self.codec.get_cell(state, i) for i in self.interchangeable_pawns)
+        for pawn, cell in zip(self.interchangeable_pawns, cells):
+            state = self.codec.set_cell(state, pawn, cell)
+        return state
 
     def compute_choices(
         self, state: "ResolutionState", target_pawn_color: Optional[Color] = None
@@ -88,37 +355,24 @@ class AIPlayer:
         pawn_colors = (
             [target_pawn_color]
             if target_pawn_color is not None
-            else Color(range(len(state.pawns)))
+            else [Color(i) for i in range(len(state.pawns))]
         )
 
         for pawn_color in pawn_colors:
             for direction in Direction:
                 target_coords = self._get_pawn_destination(state, pawn_color, direction)
-
-                # Cond: target_coords != None AND (target_pawn_color != None => target_coords not in visited_positions[pawn_color])
-                if target_coords is not None and (
-                    target_pawn_color is None
-                    or target_coords not in self.visited_positions[pawn_color.value]
-                ):
+                if target_coords is not None:
                     possible_moves.append((pawn_color, target_coords))
         return possible_moves
 
     def solve(self) -> Optional[List[Tuple[Color, Coordinate]]]:
         """
-        Find a solution using a basic breadth-first search.
+        Find a solution using the search strategy of the player.
         :return: A list of moves in the format to reach the target. None if no solution is found.
         """
-        # Initialize queue and graph structure
-        queue = deque([ResolutionState(pawns=self.state.pawns, cost=0)])
-        # Get the target pawn color
-        target_pawn_color = self.state.current_target[0]
-        # Whether we are using the target pawn or not
-        using_target_pawn = True
-        # List of explored final states
-        explored_states = []
-
         # Debug
-        target_coords = self.get_chip_coordinates(*self.state.current_target)
+        target_pawn_color = self.state.current_target[0]
+        target_coords = self.codec.decode_cell(self.target_cell)
         pawn_coords = self.state.pawns[target_pawn_color.value]
         print(
             "Target:",
@@ -128,126 +382,399 @@ class AIPlayer:
             get_color_name(target_pawn_color),
             "pawn",
             f"(at x={pawn_coords.x}, y={pawn_coords.y})",
+            f"using {self.strategy}",
         )
-        print(f"Starting search with {get_color_name(target_pawn_color)} pawn")
 
-        while queue:
-            current_state = queue.popleft()
+        if self.strategy == SearchStrategy.A_STAR:
+            solution = self._solve_a_star()
+        elif self.strategy == SearchStrategy.IDA_STAR:
+            solution = self._solve_ida_star()
+        elif self.strategy == SearchStrategy.BIDIRECTIONAL:
+            solution = self._solve_bidirectional()
+        elif self.strategy == SearchStrategy.PARALLEL:
+            solution = self._solve_parallel()
+        else:
+            solution = self._solve_breadth_first()
 
-            # Check if we've reached the target
-            if self._is_solution(current_state.pawns):
-                return current_state.get_move_sequence()
+        return solution.get_move_sequence() if solution is not None else None
 
-            # Compute all possible moves
-            moves = self.compute_choices(
-                current_state, target_pawn_color if using_target_pawn else None
-            )
-            has_valid_moves = False
+    def _solve_breadth_first(self) -> Optional[ResolutionState]:
+        """
+        Find a solution using a breadth-first search.
+        Each pawns configuration is expanded at most once.
+        :return: The solution state, None if no solution is found.
+        """
+        codec = self.codec
+        initial_state = codec.encode(self.state.pawns)
+        # Parent of every reached state, used to rebuild the moves of the solution
+        parents: Dict[int, Optional[int]] = {initial_state: None}
+        # Canonical keys of the already reached configurations
+        visited = {self.get_state_key(initial_state)}
+        # List of explored final states
+        explored_states = []
 
-            # Try all possible moves
-            for pawn_color, target_coords in moves:
-                has_valid_moves = True
+        # Explore the states layer by layer, all the states of a layer sharing the same cost
+        frontier = [initial_state]
+        cost = 0
+        while frontier:
+            next_frontier = []
+            for state in frontier:
+                # Check if we've reached the target
+                if self._is_solution(state):
+                    return ResolutionState(state, cost, codec, parents)
 
-                # Create new pawn positions list
-                new_pawns = list(current_state.pawns)
-                new_pawns[pawn_color.value] = target_coords
+                has_valid_moves = False
 
-                # Track this position as visited for this pawn
-                self.visited_positions[pawn_color.value].append(target_coords)
+                # Try all possible moves
+                for new_state in self._compute_next_states(state):
+                    # Skip configurations that have already been reached
+                    state_key = self.get_state_key(new_state)
+                    if state_key in visited:
+                        continue
+                    visited.add(state_key)
+                    has_valid_moves = True
 
-                new_state = ResolutionState(
-                    pawns=new_pawns,
-                    cost=current_state.cost + 1,
-                    previous_state=current_state,
-                )
+                    parents[new_state] = state
+                    next_frontier.append(new_state)
 
-                queue.append(new_state)
+                if not has_valid_moves:
+                    explored_states.append(ResolutionState(state, cost, codec, parents))
 
-            if not has_valid_moves:
-                explored_states.append(current_state)
+            frontier = next_frontier
+            cost += 1
 
         print("Explored states:")
         for state in explored_states:
             print(state.get_move_sequence())
         return None
 
-    def _is_solution(self, pawns: List[Coordinate]) -> bool:
+    def _get_heuristic(self, state: int) -> int:
+        """
+        Get a lower bound of the number of moves needed to reach the target.
+        :param state: The packed state.
+        :return: The distance of the target pawn to the target, `UNREACHABLE` if it can't reach it.
+        """
+        target_pawn = self.state.current_target[0].value
+        return self.target_distances[self.codec.get_cell(state, target_pawn)]
+
+    def _solve_a_star(self) -> Optional[ResolutionState]:
+        """
+        Find an optimal solution using an A* search.
+        The heuristic never overestimates the number of moves, so the first solution found is optimal.
+        :return: The solution state, None if no solution is found.
+        """
+        codec = self.codec
+        initial_state = codec.encode(self.state.pawns)
+        initial_heuristic = self._get_heuristic(initial_state)
+        if initial_heuristic == UNREACHABLE:
+            return None
+
+        parents: Dict[int, Optional[int]] = {initial_state: None}
+        # Lowest cost found for each canonical configuration
+        costs = {self.get_state_key(initial_state): 0}
+        # Priority queue ordered by estimated total cost, preferring the deepest states on ties
+        queue = [(initial_heuristic, 0, initial_state)]
+
+        while queue:
+            _, negative_cost, state = heapq.heappop(queue)
+            cost = -negative_cost
+
+            # Skip outdated entries of states reached again with a lower cost
+            if cost > costs[self.get_state_key(state)]:
+                continue
+
+            if self._is_solution(state):
+                return ResolutionState(state, cost, codec, parents)
+
+            new_cost = cost + 1
+            for new_state in self._compute_next_states(state):
+                heuristic = self._get_heuristic(new_state)
+                if heuristic == UNREACHABLE:
+                    continue
+
+                state_key = self.get_state_key(new_state)
+                if new_cost >= costs.get(state_key, new_cost + 1):
+                    continue
+                costs[state_key] = new_cost
+
+                parents[new_state] = state
+                heapq.heappush(queue, (new_cost + heuristic, -new_cost, new_state))
+
+        return None
+
+    def _solve_ida_star(self) -> Optional[ResolutionState]:
+        """
+        Find an optimal solution using an iterative deepening A* search.
+        Each iteration is a depth-first search bounded by the estimated total cost of the states.
+        Only the current path and a bounded table of the reached states are kept in memory.
+        :return: The solution state, None if no solution is found.
+        """
+        initial_state = self.codec.encode(self.state.pawns)
+        bound = self._get_heuristic(initial_state)
+        if bound == UNREACHABLE:
+            return None
+
+        while True:
+            path = [initial_state]
+            # Lowest cost at which each canonical configuration was reached during the iteration
+            costs = {self.get_state_key(initial_state): 0}
+            next_bound = self._search_ida_star(path, costs, bound)
+
+            if next_bound is None:
+                parents: Dict[int, Optional[int]] = {initial_state: None}
+                for previous_state, state in zip(path, path[1:]):
+                    parents[state] = previous_state
+                return ResolutionState(path[-1], len(path) - 1, self.codec, parents)
+
+            # No state exceeded the bound: the whole reachable space has been explored
+            if next_bound == UNREACHABLE:
+                return None
+            bound = next_bound
+
+    def _search_ida_star(
+        self, path: List[int], costs: Dict[int, int], bound: int
+    ) -> Optional[int]:
+        """
+        Depth-first search of an iteration of the IDA* search.
+        :param path: The states from the initial state to the current state, extended with the solution if found.
+        :param costs: The lowest cost at which each canonical configuration was reached.
+        :param bound: The maximum estimated total cost of the explored states.
+        :return: None if a solution is found, otherwise the lowest estimated total cost exceeding the bound.
+        """
+        state = path[-1]
+        if self._is_solution(state):
+            return None
+
+        new_cost = len(path)
+        next_bound = UNREACHABLE
+        for new_state in self._compute_next_states(state):
+            heuristic = self._get_heuristic(new_state)
+            if heuristic == UNREACHABLE:
+                continue
+            if new_cost + heuristic > bound:
+                next_bound = min(next_bound, new_cost + heuristic)
+                continue
+
+            state_key = self.get_state_key(new_state)
+            if new_cost >= costs.get(state_key, new_cost + 1):
+                continue
+            if len(costs) < IDA_STAR_TABLE_SIZE or state_key in costs:
+                costs[state_key] = new_cost
+
+            path.append(new_state)
+            result = self._search_ida_star(path, costs, bound)
+            if result is None:
+                return None
+            path.pop()
+            next_bound = min(next_bound, result)
+
+        return next_bound
+
+    def _solve_bidirectional(self) -> Optional[ResolutionState]:
+        """
+        Find an optimal solution using a bidirectional search.
+
+        Once the other pawns have made their last move, only the target pawn moves until the target is reached.
+        The forward breadth-first search therefore only needs to reach the state following the last move of
+        the other pawns, where it meets a backward search of the target pawn from the target, the other
+        pawns being fixed. The backward searches use reverse moves and are shared, in a hashed table,
+        by all the forward states with the same positions of the other pawns.
+        :return: The solution state, None if no solution is found.
+        """
+        codec = self.codec
+        target_pawn = self.state.current_target[0].value
+        initial_state = codec.encode(self.state.pawns)
+        parents: Dict[int, Optional[int]] = {initial_state: None}
+        visited = {self.get_state_key(initial_state)}
+        # Distance to the target of the target pawn, for each positions of the other pawns
+        backward_distances: Dict[Tuple[int, ...], bytearray] = {}
+        # Best solution found: (number of moves, forward state)
+        best: Optional[Tuple[int, int]] = None
+
+        frontier = [initial_state]
+        cost = 0
+        while frontier:
+            # Meet the backward searches
+            for state in frontier:
+                cells = codec.get_cells(state)
+                other_cells = tuple(
+                    sorted(cell for pawn, cell in enumerate(cells) if pawn != target_pawn)
+                )
+                distances = backward_distances.get(other_cells)
+                if distances is None:
+                    distances = self._compute_backward_distances(other_cells)
+                    backward_distances[other_cells] = distances
+                distance = distances[cells[target_pawn]]
+                if distance != UNREACHABLE and (best is None or cost + distance < best[0]):
+                    best = (cost + distance, state)
+
+            # Any solution not found yet needs a forward state after the current layer,
+            # followed by at least one move of the target pawn
+            if best is not None and best[0] <= cost + 2:
+                break
+
+            next_frontier = []
+            for state in frontier:
+                for new_state in self._compute_next_states(state):
+                    state_key = self.get_state_key(new_state)
+                    if state_key in visited:
+                        continue
+                    visited.add(state_key)
+                    parents[new_state] = state
+                    next_frontier.append(new_state)
+            frontier = next_frontier
+            cost += 1
+
+        if best is None:
+            return None
+
+        # Rebuild the forward path, then follow the backward distances of the target pawn
+        path = [best[1]]
+        while parents[path[-1]] is not None:
+            path.append(parents[path[-1]])
+        path.reverse()
+        cells = codec.get_cells(path[-1])
+        other_cells = [cell for pawn, cell in enumerate(cells) if pawn != target_pawn]
+        distances = backward_distances[tuple(sorted(other_cells))]
+        cell = cells[target_pawn]
+        while distances[cell] > 0:
+            cell = next(
+                destination
+                for direction in range(4)
+                for destination in [
+                    self.tables.get_destination(target_pawn, cell, direction, other_cells)
+                ]
+                if distances[destination] == distances[cell] - 1
+            )
+            path.append(codec.set_cell(path[-1], target_pawn, cell))
+
+        solution_parents: Dict[int, Optional[int]] = {initial_state: None}
+        for previous_state, state in zip(path, path[1:]):
+            solution_parents[state] = previous_state
+        return ResolutionState(path[-1], len(path) - 1, codec, solution_parents)
+
+    def _solve_parallel(self) -> Optional[ResolutionState]:
+        """
+        Find an optimal solution using breadth-first searches run in parallel by a pool of processes.
+
+        The first layers are expanded until there are enough subtrees to share between the processes,
+        then each subtree is searched independently. The lowest cost found is shared between the processes:
+        a search stops as soon as it can't find a cheaper solution, which cancels the remaining work
+        once a solution at the optimal depth is found.
+        :return: The solution state, None if no solution is found.
+        """
+        codec = self.codec
+        initial_state = codec.encode(self.state.pawns)
+        parents: Dict[int, Optional[int]] = {initial_state: None}
+        visited = {self.get_state_key(initial_state)}
+
+        # Expand the first layers, solutions found there are optimal
+        frontier = [initial_state]
+        cost = 0
+        while frontier and len(frontier) < self.processes * PARALLEL_TASKS_PER_PROCESS:
+            for state in frontier:
+                if self._is_solution(state):
+                    return ResolutionState(state, cost, codec, parents)
+            next_frontier = []
+            for state in frontier:
+                for new_state in self._compute_next_states(state):
+                    state_key = self.get_state_key(new_state)
+                    if state_key in visited or self._get_heuristic(new_state) == UNREACHABLE:
+                        continue
+                    visited.add(state_key)
+                    parents[new_state] = state
+                    next_frontier.append(new_state)
+            frontier = next_frontier
+            cost += 1
+        if not frontier:
+            return None
+
+        # The board tables are sent once to each process, when it starts
+        best_cost = multiprocessing.Value("i", UNREACHABLE)
+        best_path: Optional[List[int]] = None
+        with multiprocessing.Pool(
+            self.processes,
+            initializer=_init_parallel_worker,
+            initargs=(self, best_cost),
+        ) as pool:
+            tasks = [(state, cost) for state in frontier]
+            for path in pool.imap_unordered(_search_parallel_subtree, tasks):
+                if path is not None and (best_path is None or len(path) < len(best_path)):
+                    best_path = path
+
+        if best_path is None:
+            return None
+        for previous_state, state in zip(best_path, best_path[1:]):
+            parents[state] = previous_state
+        return ResolutionState(best_path[-1], cost + len(best_path) - 1, codec, parents)
+
+    def _compute_backward_distances(self, other_cells: Tuple[int, ...]) -> bytearray:
+        """
+        Compute the number of moves needed by the target pawn to reach the target when the other pawns don't move.
+        :param other_cells: The cell indexes of the other pawns.
+        :return: The distance of each cell index, `UNREACHABLE` if the target can't be reached from it.
+        """
+        target_pawn = self.state.current_target[0].value
+        distances = bytearray([UNREACHABLE]) * self.tables.number_of_cells
+        if self.target_cell in other_cells:
+            return distances
+
+        distances[self.target_cell] = 0
+        frontier = [self.target_cell]
+        while frontier:
+            next_frontier = []
+            for cell in frontier:
+                for predecessor in self.tables.get_predecessors(
+                    target_pawn, cell, other_cells
+                ):
+                    if distances[predecessor] == UNREACHABLE:
+                        distances[predecessor] = distances[cell] + 1
+                        next_frontier.append(predecessor)
+            frontier = next_frontier
+        return distances
+
+    def _is_solution(self, state: int) -> bool:
         """
         Check if the target pawn has reached the target position.
+        :param state: The packed state.
         """
         target_pawn_color = self.state.current_target[0]
-        target = self.get_chip_coordinates(*self.state.current_target)
-        return pawns[target_pawn_color.value] == target
+        return self.codec.get_cell(state, target_pawn_color.value) == self.target_cell
 
     def _get_pawn_destination(
         self,
         state: ResolutionState,
         pawn_color: Color,
         direction: Direction,
-        from_coords: Optional[Coordinate] = None,
     ) -> Optional[Coordinate]:
         """
         Get the destination coordinates for a pawn based on its direction.
         :param state: The current state.
         :param pawn_color: The color of the pawn.
         :param direction: The direction of the move (Direction enum).
-        :param from_coords: A Coordinate to override the current position of the pawn used for mirror moves.
         :return: Target coordinates as a Coordinate or None if move is invalid.
         """
-        pawn = state.pawns[pawn_color.value]
-        if not pawn:
-            return None
-
-        current_coord = from_coords if from_coords else pawn
-        x, y = current_coord.x, current_coord.y
-
-        direction_deltas = {
-            Direction.UP: (0, -1),
-            Direction.RIGHT: (1, 0),
-            Direction.DOWN: (0, 1),
-            Direction.LEFT: (-1, 0),
-        }
-        dx, dy = direction_deltas[direction]
-
-        # Check if there's a wall in the current cell blocking movement in the current direction
-        if self.state.walls[x][y][direction.value]:
-            return Coordinate(x=x, y=y)
-
-        # Move the pawn in the current direction until it hits a wall, another pawn or is reflected by a mirror
-        while (
-            0 <= x + dx < self.state.board_size and 0 <= y + dy < self.state.board_size
-        ):
-            x += dx
-            y += dy
-
-            # Check if the pawn is reflected by a mirror
-            mirror = self.state.mirrors[x][y]
-            if mirror[0] is not None:
-                if pawn_color != mirror[0]:
-                    continue
-                new_direction = self._get_reflected_direction(direction, mirror[1])
-                return self._get_pawn_destination(
-                    state, pawn_color, new_direction, Coordinate(x=x, y=y)
-                )
-
-            # Check if the pawn is blocked by a wall
-            if self.state.walls[x][y][direction.value]:
-                return Coordinate(x=x, y=y)
-
-            # Check if the pawn is blocked by another pawn
-            if self._is_pawn_at(state, Coordinate(x=x, y=y)):
-                return Coordinate(x=x - dx, y=y - dy)
-
-        return Coordinate(x=x, y=y)
+        cells = self.codec.get_cells(state.state)
+        destination = self.tables.get_destination(
+            pawn_color.value, cells[pawn_color.value], direction.value, cells
+        )
+        return self.codec.decode_cell(destination)
 
-    @staticmethod
-    def _is_pawn_at(state: ResolutionState, target_coords: Coordinate) -> bool:
+    def _compute_next_states(self, state: int) -> List[int]:
         """
-        Check if another pawn is at the target coordinates.
-        :param target_coords: Coordinates to check.
-        :return: True if a pawn is present, False otherwise.
+        Compute the packed states reachable in one move.
+        :param state: The packed state.
+        :return: The packed states, one for each pawn and direction.
         """
-        return any(p == target_coords for p in state.pawns if p is not None)
+        codec = self.codec
+        get_destination = self.tables.get_destination
+        cells = codec.get_cells(state)
+        next_states = []
+        for pawn, cell in enumerate(cells):
+            for direction in range(4):
+                destination = get_destination(pawn, cell, direction, cells)
+                next_states.append(codec.set_cell(state, pawn, destination))
+        return next_states
 
     @staticmethod
     def _get_reflected_direction(
@@ -259,21 +786,7 @@ class AIPlayer:
         :param mirror_angle: Angle of the mirror 45 (\) or 135 (/).
         :return: New direction after reflection.
         """
-        reflection_map = {
-            (Direction.UP, MirrorAngle.BACKSLASH): Direction.LEFT,
-            (Direction.UP, MirrorAngle.SLASH): Direction.RIGHT,
-            (Direction.RIGHT, MirrorAngle.SLASH): Direction.UP,
-            (Direction.RIGHT, MirrorAngle.BACKSLASH): Direction.DOWN,
-            (Direction.DOWN, MirrorAngle.BACKSLASH): Direction.RIGHT,
-            (Direction.DOWN, MirrorAngle.SLASH): Direction.LEFT,
-            (Direction.LEFT, MirrorAngle.BACKSLASH): Direction.UP,
-            (Direction.LEFT, MirrorAngle.SLASH): Direction.DOWN,
-        }
-        if (direction, mirror_angle) not in reflection_map:
-            raise ValueError(
-                f"Invalid mirror angle or direction, got {direction}, {mirror_angle}"
-            )
-        return reflection_map[(direction, mirror_angle)]
+        return get_reflected_direction(direction, mirror_angle)
 
     def get_chip_coordinates(self, color: Color, chip: Shape) -> Coordinate:
         """
@@ -282,10 +795,10 @@ class AIPlayer:
         :param chip: The chip number.
         :return: The coordinates of the chip. (x, y)
         """
-        for x, col in enumerate(self.state.chips):
-            for y, (c, ch) in enumerate(col):
-                if c == color and ch == chip:
-                    return Coordinate(x=x, y=y)
+        value = encode_chip(color, chip)
+        for x, y, cell_value in self.state.chips.items():
+            if cell_value == value:
+                return Coordinate(x=x, y=y)
         raise ValueError(f"Chip {chip} of color {color} not found on the board.")
 
 
@@ -298,29 +811,8 @@ if __name__ == "__main__":
     runtime.load_new_board()
     runtime.new_target()
 
-    # Since GameBoard use grids with [y][x] indexing,
-    # we need to adapt them by transposing the grids for [x][y] indexing.
-
-    # Transpose the grids in GameState to use x, y indexing
-    def transpose_grid(grid):
-        return [list(col) for col in zip(*grid)]
-
-    walls = transpose_grid(runtime.board.walls)
-    mirrors = transpose_grid(runtime.board.mirrors)
-    chips = transpose_grid(runtime.board.chips)
-
     # Extract data from GameRuntime to create GameState
-    game_state = GameState(
-        board_size=runtime.board.board_size,
-        walls=walls,
-        mirrors=mirrors,
-        chips=chips,
-        pawns=runtime.pawns,
-        current_target=(
-            Color(runtime.current_target[0]),
-            Shape(runtime.current_target[1]),
-        ),
-    )
+    game_state = runtime.get_game_state()
 
     # Initialize AIPlayer with GameState
     player = AIPlayer(game_state)
@@ -1,6 +1,39 @@
-from typing import List, Tuple, Optional
-
-from utils import Coordinate, Color, Shape, MirrorAngle
+import hashlib
+import random
+import struct
+from collections import deque
+from typing import Iterator, List, Optional, Tuple
+
+from utils import (
+    Coordinate,
+    Color,
+    Shape,
+    MirrorAngle,
+    Direction,
+    Grid,
+    EMPTY_CELL,
+    WALL_UP,
+    WALL_RIGHT,
+    WALL_DOWN,
+    WALL_LEFT,
+    GameState,
+    encode_chip,
+    encode_mirror,
+    decode_chip,
+)
+from move_tables import MoveTables
+
+# Version of the binary seed format, stored in its first byte
+SEED_VERSION = 2
+
+# Seed header: version, board size, number of colors, number of chips, number of mirrors
+SEED_HEADER = struct.Struct(">BBBBB")
+
+# Size in bytes of the digest of a seed
+SEED_DIGEST_SIZE = 16
+
+# Maximum number of moves of the target pawn alone to reach each target of a valid random board
+VALIDATION_MAX_MOVES = 8
 
 
 class GameBoard:
@@ -14,152 +47,131 @@ class GameBoard:
         chips=None,
         mirrors=None,
         initial_pawns_position=None,
+        random_seed: Optional[int] = None,
     ):
-        # Prevent unexpected values => TODO: Enable user defined values
-        if (
+        """
+        :param board_size: The size of the grid of the board. (`board_size` x `board_size`)
+        :param number_of_colors: The number of colors, each color having one pawn.
+        :param number_of_chips: The number of chips of each color.
+        :param number_of_mirrors: The number of mirrors of each color.
+        :param walls: The walls grid, generated if None.
+        :param chips: The chips grid, generated if None.
+        :param mirrors: The mirrors grid, generated if None.
+        :param initial_pawns_position: The initial position of the pawns, generated if None.
+        :param random_seed: If given, the generated elements are randomly generated from this seed,
+        otherwise the pre-defined board is used.
+        """
+        if number_of_colors > len(Color) or number_of_chips > len(Shape):
+            raise ValueError(
+                f"At most {len(Color)} colors and {len(Shape)} chips per color are supported."
+            )
+        if not 8 <= board_size <= 255:
+            raise ValueError(f"The board size must be between 8 and 255, got {board_size}")
+
+        # The pre-defined board only exists with the default values
+        uses_predefined_board = random_seed is None and (
+            walls is None
+            or chips is None
+            or mirrors is None
+            or initial_pawns_position is None
+        )
+        if uses_predefined_board and (
             board_size != 16
             or number_of_colors != 4
             or number_of_chips != 4
             or (number_of_mirrors != 2 and number_of_mirrors != 0)
         ):
             raise ValueError(
-                "Only the default values are currently supported. You can only disable or enable mirrors."
+                "Only the default values are supported by the pre-defined board. "
+                "You can only disable or enable mirrors, or use a random seed."
             )
 
         self.board_size = board_size
         self.number_of_colors = number_of_colors
         self.number_of_chips = number_of_chips
         self.number_of_mirrors = number_of_mirrors
-        self.walls: List[List[Tuple[bool, bool, bool, bool]]] = []
-        self.chips: List[List[Tuple[Optional[Color], Optional[Shape]]]] = []
-        self.mirrors: List[List[Tuple[Optional[Color], Optional[MirrorAngle]]]] = []
+        self.random_seed = random_seed
+        self.random = random.Random(random_seed) if random_seed is not None else None
+
+        # Generate the walls, chips and mirrors for the board, unless they are given
+        # (see `Grid` for the encoding of the cells, accessed by `grid[x, y]`)
+        self.walls: Grid = walls if walls is not None else self.generate_walls()
+        self.chips: Grid = chips if chips is not None else self.generate_chips()
+        self.mirrors: Grid = mirrors if mirrors is not None else self.generate_mirrors()
+        self.initial_pawns_position = (
+            initial_pawns_position
+            if initial_pawns_position is not None
+            else self.set_initial_pawns_position()
+        )
+
+    def get_center_span(self) -> Tuple[int, int]:
+        """
+        Get the span of the center zone, where no pawn can go (regardless if even or odd board size).
+        :return: The first and last row (or column) of the center zone.
+        """
+        is_even = self.board_size % 2 == 0
+        center = self.board_size // 2
+        return center - 1, center if is_even else center + 1
+
+    def is_in_center(self, x: int, y: int, margin: int = 0) -> bool:
+        """
+        Check if a cell is in the center zone.
+        :param x: The column of the cell.
+        :param y: The row of the cell.
+        :param margin: The number of cells around the center zone also considered in it.
+        :return: True if the cell is in the center zone.
+        """
+        center_start, center_end = self.get_center_span()
+        return (
+            center_start - margin <= x <= center_end + margin
+            and center_start - margin <= y <= center_end + margin
+        )
 
-        # Generate the walls, chips and mirrors for the board
-        self.walls = self.generate_walls()
-        self.chips = self.generate_chips()
-        self.mirrors = self.generate_mirrors()
-        self.initial_pawns_position = self.set_initial_pawns_position()
+    def add_wall(self, walls: Grid, x: int, y: int, direction: Direction) -> None:
+        """
+        Add a wall on a side of a cell, and on the opposite side of the neighbouring cell.
+        :param walls: The walls grid to update.
+        :param x: The column of the cell.
+        :param y: The row of the cell.
+        :param direction: The side of the cell.
+        """
+        dx, dy = [(0, -1), (1, 0), (0, 1), (-1, 0)][direction.value]
+        walls[x, y] |= 1 << direction.value
+        if 0 <= x + dx < self.board_size and 0 <= y + dy < self.board_size:
+            walls[x + dx, y + dy] |= 1 << ((direction.value + 2) % 4)
 
-    def generate_walls(self) -> List[List[Tuple[bool, bool, bool, bool]]]:
+    def generate_walls(self) -> Grid:
         """
         Generate the walls for a board based on the given parameters.
 
-        :return: a board grid with the walls from a cell perspective (north, east, south, west)
+        :return: a board grid with the walls bitmask of each cell (see `Grid`)
         """
 
         # Generate a board grid with no walls
-        board = [
-            [(False, False, False, False) for _ in range(self.board_size)]
-            for _ in range(self.board_size)
-        ]
-
-        # Compute the center zone span (regardless if even or odd board size)
-        is_even = self.board_size % 2 == 0
-        center = self.board_size // 2
-        center_start = center - 1
-        center_end = center if is_even else center + 1
+        board = Grid(self.board_size)
+        center_start, center_end = self.get_center_span()
 
         # Add walls around the center zone
-        for row in range(center_start, center_end + 1):
-            for col in range(center_start, center_end + 1):
-                # Add walls if on the border of the center zone
-                if row == center_start:
-                    # Add a north wall
-                    board[row][col] = (
-                        True,
-                        board[row][col][1],
-                        board[row][col][2],
-                        board[row][col][3],
-                    )
-                    # Add a south wall to the above cell
-                    if row - 1 >= 0:
-                        board[row - 1][col] = (
-                            board[row - 1][col][0],
-                            board[row - 1][col][1],
-                            True,
-                            board[row - 1][col][3],
-                        )
-                if row == center_end:
-                    # Add a south wall
-                    board[row][col] = (
-                        board[row][col][0],
-                        board[row][col][1],
-                        True,
-                        board[row][col][3],
-                    )
-                    # Add a north wall to the below cell
-                    if row + 1 < self.board_size:
-                        board[row + 1][col] = (
-                            True,
-                            board[row + 1][col][1],
-                            board[row + 1][col][2],
-                            board[row + 1][col][3],
-                        )
-                if col == center_start:
-                    # Add a west wall
-                    board[row][col] = (
-                        board[row][col][0],
-                        board[row][col][1],
-                        board[row][col][2],
-                        True,
-                    )
-                    # Add an east wall to the left cell
-                    if col - 1 >= 0:
-                        board[row][col - 1] = (
-                            board[row][col - 1][0],
-                            True,
-                            board[row][col - 1][2],
-                            board[row][col - 1][3],
-                        )
-                if col == center_end:
-                    # Add an east wall
-                    board[row][col] = (
-                        board[row][col][0],
-                        True,
-                        board[row][col][2],
-                        board[row][col][3],
-                    )
-                    # Add a west wall to the right cell
-                    if col + 1 < self.board_size:
-                        board[row][col + 1] = (
-                            board[row][col + 1][0],
-                            board[row][col + 1][1],
-                            board[row][col + 1][2],
-                            True,
-                        )
+        for i in range(center_start, center_end + 1):
+            self.add_wall(board, i, center_start, Direction.UP)
+            self.add_wall(board, i, center_end, Direction.DOWN)
+            self.add_wall(board, center_start, i, Direction.LEFT)
+            self.add_wall(board, center_end, i, Direction.RIGHT)
 
         # Walls around the board
-        for row in range(self.board_size):
-            end = self.board_size - 1
-            if row == 0:
-                # Add a north wall
-                for col in range(self.board_size):
-                    board[row][col] = (
-                        True,
-                        board[row][col][1],
-                        board[row][col][2],
-                        board[row][col][3],
-                    )
-            if row == end:
-                # Add a south wall
-                for col in range(self.board_size):
-                    board[row][col] = (
-                        board[row][col][0],
-                        board[row][col][1],
-                        True,
-                        board[row][col][3],
-                    )
-            # Add a west wall
-            board[row][0] = (board[row][0][0], board[row][0][1], board[row][0][2], True)
-            # Add an east wall
-            board[row][end] = (
-                board[row][end][0],
-                True,
-                board[row][end][2],
-                board[row][end][3],
-            )
-
-        # Generate a pre-defined board walls declaration => TODO: Generate random walls
+        end = self.board_size - 1
+        for i in range(self.board_size):
+            board[i, 0] |= WALL_UP
+            board[i, end] |= WALL_DOWN
+            board[0, i] |= WALL_LEFT
+            board[end, i] |= WALL_RIGHT
+
+        if self.random is not None:
+            self.generate_random_walls(board)
+            return board
+
+        # Generate a pre-defined board walls declaration
+        # (row, col) of the cells with a south wall
         horizontal = [
             (1, 10),
             (2, 0),
@@ -181,6 +193,7 @@ class GameBoard:
             (13, 9),
             (14, 3),
         ]
+        # (row, col) of the cells with an east wall
         vertical = [
             (0, 4),
             (0, 8),
@@ -205,43 +218,22 @@ class GameBoard:
 
         # Write the walls into the board
         for row, col in horizontal:
-            board[row][col] = (
-                board[row][col][0],
-                board[row][col][1],
-                True,
-                board[row][col][3],
-            )
-            if row < self.board_size - 1:
-                board[row + 1][col] = (
-                    True,
-                    board[row + 1][col][1],
-                    board[row + 1][col][2],
-                    board[row + 1][col][3],
-                )
+            self.add_wall(board, col, row, Direction.DOWN)
         for row, col in vertical:
-            board[row][col] = (
-                board[row][col][0],
-                True,
-                board[row][col][2],
-                board[row][col][3],
-            )
-            if col < self.board_size - 1:
-                board[row][col + 1] = (
-                    board[row][col + 1][0],
-                    board[row][col + 1][1],
-                    board[row][col + 1][2],
-                    True,
-                )
+            self.add_wall(board, col, row, Direction.RIGHT)
 
         return board
 
-    def generate_chips(self) -> List[List[Tuple[Optional[Color], Optional[Shape]]]]:
+    def generate_chips(self) -> Grid:
         """
         Generate the chips for a board based on the given parameters.
 
-        :return: a board grid with the chips from a cell perspective (color, chip)
+        :return: a board grid with the chip of each cell (see `Grid`)
         """
-        # Generate a pre-defined board chips declaration => TODO: Generate random chips
+        if self.random is not None:
+            return self.generate_random_chips()
+
+        # Generate a pre-defined board chips declaration
         chips_positions = [
             [(1, 10), (4, 3), (10, 14), (14, 3)],  # Red
             [(3, 12), (4, 2), (13, 6), (13, 10)],  # Green
@@ -250,33 +242,29 @@ class GameBoard:
         ]
 
         # Map the chips to the board grid
-        board = [
-            [(None, None) for _ in range(self.board_size)]
-            for _ in range(self.board_size)
-        ]
+        board = Grid(self.board_size, fill=EMPTY_CELL)
         for color, chips_of_color in enumerate(chips_positions):
             for chip, (y, x) in enumerate(chips_of_color):
-                board[y][x] = (Color(color), Shape(chip))
+                board[x, y] = encode_chip(Color(color), Shape(chip))
 
         return board
 
-    def generate_mirrors(
-        self,
-    ) -> List[List[Tuple[Optional[Color], Optional[MirrorAngle]]]]:
+    def generate_mirrors(self) -> Grid:
         """
         Generate the mirrors for a board based on the given parameters.
 
         Note: forwards mirrors angle is 135°, backwards mirrors angle is 45°
 
-        :return: a board grid with the mirrors (colors, angle) from a cell perspective
+        :return: a board grid with the mirror of each cell (see `Grid`)
         """
+        if self.random is not None:
+            return self.generate_random_mirrors()
+
+        board = Grid(self.board_size, fill=EMPTY_CELL)
         if self.number_of_mirrors == 0:
-            return [
-                [(None, None) for _ in range(self.board_size)]
-                for _ in range(self.board_size)
-            ]
+            return board
 
-        # Generate a pre-defined board mirrors declaration => TODO: Generate random mirrors
+        # Generate a pre-defined board mirrors declaration
         mirrors_positions = [
             [(2, 14, 45), (11, 8, 135)],  # Red
             [(3, 9, 45), (11, 1, 135)],  # Green
@@ -285,13 +273,9 @@ class GameBoard:
         ]
 
         # Map the mirrors to the board grid
-        board = [
-            [(None, None) for _ in range(self.board_size)]
-            for _ in range(self.board_size)
-        ]
         for color, mirrors_of_color in enumerate(mirrors_positions):
             for _chip, (y, x, angle) in enumerate(mirrors_of_color):
-                board[y][x] = (Color(color), MirrorAngle(angle))
+                board[x, y] = encode_mirror(Color(color), MirrorAngle(angle))
 
         return board
 
@@ -301,7 +285,10 @@ class GameBoard:
 
         :return: a list of Coordinate with the initial position of the pawns
         """
-        # Generate a pre-defined board pawns declaration => TODO: Generate random pawns
+        if self.random is not None:
+            return self.generate_random_pawns()
+
+        # Generate a pre-defined board pawns declaration
         pawns_positions = [
             (5, 1),  # Red
             (10, 12),  # Green
@@ -310,59 +297,356 @@ class GameBoard:
         ]
         return [Coordinate(x=x, y=y) for y, x in pawns_positions]
 
-    def get_seed(self) -> str:
+    def generate_random_walls(self, walls: Grid) -> None:
+        """
+        Add random walls to a board grid, in the style of the physical game.
+
+        Each quarter of the board gets the same share of corners (two walls forming an angle around a cell),
+        where the chips are placed, and one wall on each of its two borders.
+
+        :param walls: The walls grid with the center zone and border walls, updated in place.
+        """
+        half = self.board_size // 2
+        end = self.board_size - 1
+        quarters = [(0, 0), (1, 0), (0, 1), (1, 1)]
+        number_of_corners = self.number_of_colors * self.number_of_chips
+
+        corners: List[Tuple[int, int]] = []
+        for quarter_index, (qx, qy) in enumerate(quarters):
+            x_range = range(max(1, qx * half), min(end, (qx + 1) * half))
+            y_range = range(max(1, qy * half), min(end, (qy + 1) * half))
+
+            # Border walls, away from the board corners
+            x = self.random.randrange(x_range.start + 1, x_range.stop - 1)
+            side = 0 if qy == 0 else end
+            self.add_wall(walls, x, side, Direction.RIGHT)
+            y = self.random.randrange(y_range.start + 1, y_range.stop - 1)
+            side = 0 if qx == 0 else end
+            self.add_wall(walls, side, y, Direction.DOWN)
+
+            # Corners, not touching each other nor the center zone
+            quarter_corners = number_of_corners // 4 + (
+                quarter_index < number_of_corners % 4
+            )
+            candidates = [
+                (x, y)
+                for x in x_range
+                for y in y_range
+                if not self.is_in_center(x, y, margin=1)
+            ]
+            self.random.shuffle(candidates)
+            placed = 0
+            for x, y in candidates:
+                if placed == quarter_corners:
+                    break
+                if any(abs(x - cx) <= 1 and abs(y - cy) <= 1 for cx, cy in corners):
+                    continue
+                corners.append((x, y))
+                placed += 1
+                self.add_wall(walls, x, y, self.random.choice([Direction.UP, Direction.DOWN]))
+                self.add_wall(
+                    walls, x, y, self.random.choice([Direction.LEFT, Direction.RIGHT])
+                )
+
+    def get_free_cells(self, *grids: Grid) -> List[Tuple[int, int]]:
+        """
+        Get the cells outside of the center zone, with no chip or mirror in the given grids.
+        :param grids: The chips or mirrors grids to check.
+        :return: The (x, y) coordinates of the free cells.
+        """
+        return [
+            (x, y)
+            for x in range(self.board_size)
+            for y in range(self.board_size)
+            if not self.is_in_center(x, y)
+            and all(grid[x, y] == EMPTY_CELL for grid in grids)
+        ]
+
+    def generate_random_chips(self) -> Grid:
+        """
+        Place the chips on random corners of the walls, or on random free cells if there are not enough corners.
+
+        :return: a board grid with the chip of each cell (see `Grid`)
+        """
+        board = Grid(self.board_size, fill=EMPTY_CELL)
+        end = self.board_size - 1
+        corners = [
+            (x, y)
+            for x in range(1, end)
+            for y in range(1, end)
+            if not self.is_in_center(x, y, margin=1)
+            and self.walls[x, y] & (WALL_UP | WALL_DOWN)
+            and self.walls[x, y] & (WALL_LEFT | WALL_RIGHT)
+        ]
+        self.random.shuffle(corners)
+
+        chips = [
+            encode_chip(Color(color), Shape(shape))
+            for color in range(self.number_of_colors)
+            for shape in range(self.number_of_chips)
+        ]
+        if len(corners) < len(chips):
+            other_cells = [cell for cell in self.get_free_cells() if cell not in corners]
+            corners += self.random.sample(other_cells, len(chips) - len(corners))
+
+        for (x, y), chip in zip(corners, chips):
+            board[x, y] = chip
+        return board
+
+    def generate_random_mirrors(self) -> Grid:
+        """
+        Place the mirrors of each color on random free cells, with random angles.
+
+        :return: a board grid with the mirror of each cell (see `Grid`)
+        """
+        board = Grid(self.board_size, fill=EMPTY_CELL)
+        cells = self.random.sample(
+            self.get_free_cells(self.chips),
+            self.number_of_colors * self.number_of_mirrors,
+        )
+        for i, (x, y) in enumerate(cells):
+            color = Color(i // self.number_of_mirrors)
+            board[x, y] = encode_mirror(color, self.random.choice(list(MirrorAngle)))
+        return board
+
+    def generate_random_pawns(self) -> List[Coordinate]:
+        """
+        Place the pawns on random free cells.
+
+        :return: a list of Coordinate with the initial position of the pawns
+        """
+        cells = self.random.sample(
+            self.get_free_cells(self.chips, self.mirrors), self.number_of_colors
+        )
+        return [Coordinate(x=x, y=y) for x, y in cells]
+
+    def get_unreachable_targets(
+        self, max_moves: int = VALIDATION_MAX_MOVES
+    ) -> List[Tuple[Color, Shape]]:
+        """
+        Get the targets that the pawn of their color can't reach alone, the other pawns not moving.
+        Reaching all the targets this way guarantees that every target has a solution.
+        :param max_moves: The maximum number of moves of the pawn.
+        :return: The (color, shape) of the targets not reached within `max_moves` moves.
+        """
+        state = GameState(
+            board_size=self.board_size,
+            walls=self.walls,
+            mirrors=self.mirrors,
+            chips=self.chips,
+            pawns=self.initial_pawns_position,
+            current_target=None,
+        )
+        tables = MoveTables(state)
+        pawns = [coords.x * self.board_size + coords.y for coords in self.initial_pawns_position]
+
+        # Cells reached by each pawn alone within the maximum number of moves
+        reached_cells: List[set] = []
+        for color, start in enumerate(pawns):
+            other_pawns = [cell for pawn, cell in enumerate(pawns) if pawn != color]
+            reached = {start}
+            queue = deque([(start, 0)])
+            while queue:
+                cell, moves = queue.popleft()
+                if moves == max_moves:
+                    continue
+                for direction in range(4):
+                    destination = tables.get_destination(
+                        color, cell, direction, other_pawns
+                    )
+                    if destination not in reached:
+                        reached.add(destination)
+                        queue.append((destination, moves + 1))
+            reached_cells.append(reached)
+
+        unreachable = []
+        for cell, value in enumerate(self.chips.to_bytes()):
+            color, shape = decode_chip(value)
+            if color is not None and cell not in reached_cells[color.value]:
+                unreachable.append((color, shape))
+        return unreachable
+
+    def is_valid(self, max_moves: int = VALIDATION_MAX_MOVES) -> bool:
+        """
+        Check if every target of the board is reachable by the pawn of its color alone.
+        :param max_moves: The maximum number of moves of the pawn.
+        :return: True if all the targets are reachable within `max_moves` moves.
+        """
+        return not self.get_unreachable_targets(max_moves)
+
+    def get_seed(self) -> bytes:
         """
         Get the seed for the current board configuration.
+
+        The seed is a compact binary encoding of the board:
+        - a header with the format version and the board properties,
+        - the walls bitmask of each cell, two cells per byte,
+        - the chips, mirrors and pawns, each list prefixed by its length.
+        Cells are referenced by their index `x * board_size + y`.
+
         :return: The seed for the current board configuration
         """
-        # Converting board properties to hexadecimal values
-        hex_board_size = format(self.board_size, "x")
-        hex_number_of_colors = format(self.number_of_colors, "x")
-        hex_number_of_chips = format(self.number_of_chips, "x")
-        hex_number_of_mirrors = format(self.number_of_mirrors, "x")
+        header = SEED_HEADER.pack(
+            SEED_VERSION,
+            self.board_size,
+            self.number_of_colors,
+            self.number_of_chips,
+            self.number_of_mirrors,
+        )
 
-        # Serialize walls, chips, mirrors, and pawns in custom format
-        hex_walls = ";".join(
-            [
-                f"{i},{j},{wall}"
-                for i, row in enumerate(self.walls)
-                for j, cell in enumerate(row)
-                for wall, exists in enumerate(cell)
-                if exists
-            ]
+        # Pack the walls of two cells per byte
+        wall_fields = self.walls.to_bytes()
+        if len(wall_fields) % 2:
+            wall_fields += b"\x00"
+        walls = bytes(
+            wall_fields[i] | (wall_fields[i + 1] << 4)
+            for i in range(0, len(wall_fields), 2)
         )
-        hex_chips = ";".join(
+
+        # Pack the cell index with the encoded value of each chip and mirror
+        chips = [
+            (cell, value)
+            for cell, value in enumerate(self.chips.to_bytes())
+            if value != EMPTY_CELL
+        ]
+        mirrors = [
+            (cell, value)
+            for cell, value in enumerate(self.mirrors.to_bytes())
+            if value != EMPTY_CELL
+        ]
+        pawns = [
+            coord.x * self.board_size + coord.y for coord in self.initial_pawns_position
+        ]
+
+        return b"".join(
             [
-                f"{i},{j},{color},{chip}"
-                for i, row in enumerate(self.chips)
-                for j, (color, chip) in enumerate(row)
-                if color is not None
+                header,
+                walls,
+                struct.pack(">H", len(chips)),
+                b"".join(struct.pack(">HB", cell, value) for cell, value in chips),
+                struct.pack(">H", len(mirrors)),
+                b"".join(struct.pack(">HB", cell, value) for cell, value in mirrors),
+                struct.pack(">B", len(pawns)),
+                b"".join(struct.pack(">H", cell) for cell in pawns),
             ]
         )
-        hex_mirrors = ";".join(
-            [
-                f"{i},{j},{color},{angle}"
-                for i, row in enumerate(self.mirrors)
-                for j, (color, angle) in enumerate(row)
-                if color is not None
-            ]
+
+    def get_digest(self) -> bytes:
+        """
+        Get a fixed-length digest of the seed, identifying the board configuration.
+        :return: The digest of the seed.
+        """
+        return hashlib.blake2b(self.get_seed(), digest_size=SEED_DIGEST_SIZE).digest()
+
+    @staticmethod
+    def from_seed(seed: bytes) -> "GameBoard":
+        """
+        Rebuild a board from its seed.
+        :param seed: The seed, as returned by `get_seed`.
+        :return: The board.
+        """
+        version, board_size, number_of_colors, number_of_chips, number_of_mirrors = (
+            SEED_HEADER.unpack_from(seed)
         )
-        hex_pawns = ";".join(
-            [f"{coord.y},{coord.x}" for coord in self.initial_pawns_position]
+        if version != SEED_VERSION:
+            raise ValueError(f"Unsupported seed version, got {version}")
+        offset = SEED_HEADER.size
+
+        # Unpack the walls
+        number_of_cells = board_size * board_size
+        walls_size = (number_of_cells + 1) // 2
+        walls = Grid(
+            board_size,
+            data=bytearray(
+                (byte >> shift) & 0xF
+                for byte in seed[offset : offset + walls_size]
+                for shift in (0, 4)
+            )[:number_of_cells],
+        )
+        offset += walls_size
+
+        # Unpack the chips and mirrors
+        chips = Grid(board_size, fill=EMPTY_CELL)
+        (count,) = struct.unpack_from(">H", seed, offset)
+        offset += 2
+        for _ in range(count):
+            cell, value = struct.unpack_from(">HB", seed, offset)
+            offset += 3
+            chips.data[cell] = value
+
+        mirrors = Grid(board_size, fill=EMPTY_CELL)
+        (count,) = struct.unpack_from(">H", seed, offset)
+        offset += 2
+        for _ in range(count):
+            cell, value = struct.unpack_from(">HB", seed, offset)
+            offset += 3
+            mirrors.data[cell] = value
+
+        # Unpack the pawns
+        (count,) = struct.unpack_from(">B", seed, offset)
+        offset += 1
+        pawns = []
+        for _ in range(count):
+            (cell,) = struct.unpack_from(">H", seed, offset)
+            offset += 2
+            x, y = divmod(cell, board_size)
+            pawns.append(Coordinate(x=x, y=y))
+
+        return GameBoard(
+            board_size=board_size,
+            number_of_colors=number_of_colors,
+            number_of_chips=number_of_chips,
+            number_of_mirrors=number_of_mirrors,
+            walls=walls,
+            chips=chips,
+            mirrors=mirrors,
+            initial_pawns_position=pawns,
         )
-
-        # Combine all into a single string with separators
-        seed_string = f"{hex_board_size}-{hex_number_of_colors}-{hex_number_of_chips}-{hex_number_of_mirrors}|{hex_walls}|{hex_chips}|{hex_mirrors}|{hex_pawns}"
-        return seed_string
 
     @staticmethod
-    def get_random():
+    def get_random(
+        number_of_mirrors: int = 2,
+        max_moves: int = VALIDATION_MAX_MOVES,
+        rng: Optional[random.Random] = None,
+        **board_parameters,
+    ) -> "GameBoard":
         """
-        Generate a random board.
+        Generate a random board, every target being reachable (see `is_valid`).
+        :param number_of_mirrors: The number of mirrors of each color.
+        :param max_moves: The maximum number of moves of the target pawn alone to reach each target.
+        :param rng: The random generator drawing the seeds of the boards, the global one if None.
+        :param board_parameters: Other parameters of the board (size, number of colors or chips).
         :return: A board object.
         """
-        # TODO: Implement random board generation
-        return GameBoard()
+        rng = rng or random
+        while True:
+            board = GameBoard(
+                number_of_mirrors=number_of_mirrors,
+                random_seed=rng.getrandbits(64),
+                **board_parameters,
+            )
+            if board.is_valid(max_moves):
+                return board
+
+
+def generate_valid_boards(
+    count: int,
+    seed: Optional[int] = None,
+    max_moves: int = VALIDATION_MAX_MOVES,
+    **board_parameters,
+) -> Iterator[GameBoard]:
+    """
+    Generate random boards with every target reachable.
+    The same seed always generates the same boards.
+    :param count: The number of boards.
+    :param seed: The seed of the random generator drawing the seeds of the boards.
+    :param max_moves: The maximum number of moves of the target pawn alone to reach each target.
+    :param board_parameters: Parameters of the boards (size, number of colors, chips or mirrors).
+    :return: An iterator of the boards.
+    """
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield GameBoard.get_random(max_moves=max_moves, rng=rng, **board_parameters)
 
 
 if __name__ == "__main__":
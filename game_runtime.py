@@ -1,7 +1,13 @@
 import random
-from typing import List, Tuple, Optional
+from typing import Dict, List, Set, Tuple, Optional
 
+from ai_player import AIPlayer, SearchStrategy, solve_all_targets
 from game_board import GameBoard, Coordinate
+from solution_cache import SolutionCache
+from utils import Color, GameState, Shape
+
+# Maximum number of moves of the solutions of the targets selected by the game
+TARGET_MAX_MOVES = 8
 
 
 class GameRuntime:
@@ -9,12 +15,38 @@ class GameRuntime:
     This is the class that will be used to run Rasende Roboter game, also known as Ricochet Robots.
     """
 
-    def __init__(self):
+    def __init__(self, solution_cache: Optional[SolutionCache] = None):
+        """
+        :param solution_cache: The cache of the solutions found by the AI player, solutions are not cached if None.
+        """
+        self.solution_cache = solution_cache
         self.board: Optional["GameBoard"] = None
         self.pawns: List[Coordinate] = []
         self.current_target: Optional[Tuple[int, int]] = None
         self.targets_history: List[Tuple[int, int]] = []
-        self.boards_history: List[str] = []
+        # Digests of the seeds of the boards already played
+        self.boards_history: Set[bytes] = set()
+        self.target_solutions: Optional[
+            Dict[Tuple[Color, Shape], Optional[List[Tuple[Color, Coordinate]]]]
+        ] = None
+
+    def get_game_state(self) -> GameState:
+        """
+        Get the state of the game, as used by the AI player.
+        :return: The game state.
+        """
+        return GameState(
+            board_size=self.board.board_size,
+            walls=self.board.walls,
+            mirrors=self.board.mirrors,
+            chips=self.board.chips,
+            pawns=self.pawns,
+            current_target=(
+                (Color(self.current_target[0]), Shape(self.current_target[1]))
+                if self.current_target is not None
+                else None
+            ),
+        )
 
     def new_target(self) -> None:
         """
@@ -23,17 +55,23 @@ class GameRuntime:
         Shape of the target: (color, chip)
         Set to none if no target is available.
         """
-        # List of reachable targets without moving any other pawn
+        # Solve all the targets of the board at once, the first time a target is selected
+        if self.target_solutions is None:
+            self.target_solutions = solve_all_targets(
+                self.get_game_state(), max_cost=TARGET_MAX_MOVES
+            )
+            if self.solution_cache is not None:
+                seed = self.board.get_seed()
+                for target, solution in self.target_solutions.items():
+                    if solution is not None:
+                        self.solution_cache.put(seed, self.pawns, target, solution)
+
+        # List of targets reachable within the maximum number of moves
         reachable_targets = [
             # (color, chip)
-            (1, 0),  # Green - Circle
-            (1, 2),  # Green - Triangle
-            (2, 2),  # Blue - Triangle
-            (2, 3),  # Blue - Star
-            (3, 0),  # Yellow - Circle
-            (3, 1),  # Yellow - Square
-            (3, 2),  # Yellow - Triangle
-            (3, 3),  # Yellow - Star
+            (color.value, shape.value)
+            for (color, shape), solution in self.target_solutions.items()
+            if solution is not None
         ]
 
         # Remove targets that have been selected before
@@ -52,6 +90,27 @@ class GameRuntime:
         self.current_target = random.choice(reachable_targets)
         self.targets_history.append(self.current_target)
 
+    def solve_current_target(
+        self, strategy: SearchStrategy = SearchStrategy.A_STAR
+    ) -> Optional[List[Tuple[Color, Coordinate]]]:
+        """
+        Find an optimal solution for the current target, reusing the cached solutions if available.
+        :param strategy: The search strategy used by the AI player.
+        :return: The moves of the solution, None if no solution is found.
+        """
+        target = (Color(self.current_target[0]), Shape(self.current_target[1]))
+        seed = self.board.get_seed()
+
+        if self.solution_cache is not None:
+            solution = self.solution_cache.get(seed, self.pawns, target)
+            if solution is not None:
+                return solution
+
+        solution = AIPlayer(self.get_game_state(), strategy=strategy).solve()
+        if solution is not None and self.solution_cache is not None:
+            self.solution_cache.put(seed, self.pawns, target, solution)
+        return solution
+
     def load_new_board(self) -> None:
         """
         Load a new board to the game.
@@ -59,9 +118,11 @@ class GameRuntime:
         new_board = GameBoard.get_random()
 
         # Check if the board has been selected before
-        if new_board.get_seed() in self.boards_history:
+        digest = new_board.get_digest()
+        if digest in self.boards_history:
             return self.load_new_board()
 
         self.board = new_board
-        self.boards_history.append(self.board.get_seed())
+        self.boards_history.add(digest)
         self.pawns = self.board.initial_pawns_position
+        self.target_solutions = None
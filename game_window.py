@@ -14,6 +14,15 @@ from PyQt6.QtGui import QBrush, QPolygonF, QPen, QPainterPath
 from PyQt6.QtCore import Qt, QPointF
 
 from game_runtime import GameRuntime
+from utils import (
+    MirrorAngle,
+    WALL_UP,
+    WALL_RIGHT,
+    WALL_DOWN,
+    WALL_LEFT,
+    decode_chip,
+    decode_mirror,
+)
 
 
 class GameWindow(QMainWindow):
@@ -100,9 +109,10 @@ class GameWindow(QMainWindow):
                 self.scene.addItem(rect)
 
                 # Draw walls
-                if walls_grid[i][j][0]:  # North wall
+                walls = walls_grid[j, i]
+                if walls & WALL_UP:  # North wall
                     self.scene.addLine(x1, y1, x1 + self.cell_size, y1, pen)
-                if walls_grid[i][j][1]:  # East wall
+                if walls & WALL_RIGHT:  # East wall
                     self.scene.addLine(
                         x1 + self.cell_size,
                         y1,
@@ -110,7 +120,7 @@ class GameWindow(QMainWindow):
                         y1 + self.cell_size,
                         pen,
                     )
-                if walls_grid[i][j][2]:  # South wall
+                if walls & WALL_DOWN:  # South wall
                     self.scene.addLine(
                         x1,
                         y1 + self.cell_size,
@@ -118,25 +128,24 @@ class GameWindow(QMainWindow):
                         y1 + self.cell_size,
                         pen,
                     )
-                if walls_grid[i][j][3]:  # West wall
+                if walls & WALL_LEFT:  # West wall
                     self.scene.addLine(x1, y1, x1, y1 + self.cell_size, pen)
 
                 # Draw chips
-                chip = chips_grid[i][j]
-                if chip[0] is not None and chip[1] is not None:
-                    self.draw_shape(x1, y1, chip[0], chip[1], (i, j))
+                chip_color, chip_shape = decode_chip(chips_grid[j, i])
+                if chip_color is not None and chip_shape is not None:
+                    self.draw_shape(x1, y1, chip_color.value, chip_shape.value, (i, j))
 
                 # Draw mirrors
-                mirror = mirrors_grid[i][j]
-                if mirror[0] is not None and mirror[1] is not None:
-                    color = GameWindow.get_color(mirror[0])
-                    angle = mirror[1]
+                mirror_color, angle = decode_mirror(mirrors_grid[j, i])
+                if mirror_color is not None and angle is not None:
+                    color = GameWindow.get_color(mirror_color.value)
                     mirror_pen = QPen(color)
                     mirror_pen.setWidth(3)  # Set thickness to 3 pixels for mirrors
 
                     margin = self.cell_size * 0.1  # 10% of the cell size
 
-                    if angle == 45:
+                    if angle == MirrorAngle.BACKSLASH:
                         self.scene.addLine(
                             x1 + margin,
                             y1 + margin,
@@ -144,7 +153,7 @@ class GameWindow(QMainWindow):
                             y1 + self.cell_size - margin,
                             mirror_pen,
                         )
-                    elif angle == 135:
+                    elif angle == MirrorAngle.SLASH:
                         self.scene.addLine(
                             x1 + self.cell_size - margin,
                             y1 + margin,
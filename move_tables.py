@@ -0,0 +1,244 @@
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+
+from utils import Color, Direction, GameState, MirrorAngle, decode_mirror
+
+# Distance of the cells from which a target can't be reached
+UNREACHABLE = 255
+
+# Cell delta (dx, dy) of a single step for each direction value
+DIRECTION_DELTAS = [(0, -1), (1, 0), (0, 1), (-1, 0)]
+
+REFLECTION_MAP = {
+    (Direction.UP, MirrorAngle.BACKSLASH): Direction.LEFT,
+    (Direction.UP, MirrorAngle.SLASH): Direction.RIGHT,
+    (Direction.RIGHT, MirrorAngle.SLASH): Direction.UP,
+    (Direction.RIGHT, MirrorAngle.BACKSLASH): Direction.DOWN,
+    (Direction.DOWN, MirrorAngle.BACKSLASH): Direction.RIGHT,
+    (Direction.DOWN, MirrorAngle.SLASH): Direction.LEFT,
+    (Direction.LEFT, MirrorAngle.BACKSLASH): Direction.UP,
+    (Direction.LEFT, MirrorAngle.SLASH): Direction.DOWN,
+}
+
+
+def get_reflected_direction(direction: Direction, mirror_angle: MirrorAngle) -> Direction:
+    """
+    Get the new direction based on the mirror's angle.
+    :param direction: Current direction of the pawn.
+    :param mirror_angle: Angle of the mirror 45 (\\) or 135 (/).
+    :return: New direction after reflection.
+    """
+    if (direction, mirror_angle) not in REFLECTION_MAP:
+        raise ValueError(
+            f"Invalid mirror angle or direction, got {direction}, {mirror_angle}"
+        )
+    return REFLECTION_MAP[(direction, mirror_angle)]
+
+
+class MoveTables:
+    """
+    Precomputed pawn moves for a board.
+
+    For every (pawn color, cell, direction), the tables store the ray of the cells traversed by a pawn
+    moving from the cell when no other pawn is on the board. The ray follows the mirrors of the pawn color,
+    and its last cell is the one where the pawn is stopped by a wall.
+    A move is then resolved by looking up where the first other pawn lies on the ray.
+
+    Cells are referenced by their index `x * board_size + y` (see `StateCodec`).
+    """
+
+    def __init__(self, state: GameState):
+        self.board_size = state.board_size
+        self.number_of_cells = state.board_size * state.board_size
+        self.number_of_colors = len(state.pawns)
+
+        # Tables indexed by `get_index(color, cell, direction)`
+        self.rays: List[Tuple[int, ...]] = []
+        self.ray_indexes: List[Dict[int, int]] = []
+
+        for color in range(self.number_of_colors):
+            for cell in range(self.number_of_cells):
+                for direction in Direction:
+                    ray = self._compute_ray(state, Color(color), cell, direction)
+                    self.rays.append(ray)
+                    self.ray_indexes.append({c: i for i, c in enumerate(ray)})
+
+        self._distance_maps: Dict[Tuple[int, int], List[int]] = {}
+        # Reverse tables of each color, built on demand
+        self._stop_moves: Dict[int, List[List[int]]] = {}
+        self._passing_moves: Dict[int, List[List[Tuple[int, int]]]] = {}
+
+    def get_index(self, color: int, cell: int, direction: int) -> int:
+        """
+        Get the index of a move in the tables.
+        :param color: The color value of the moving pawn.
+        :param cell: The cell index the pawn moves from.
+        :param direction: The direction value of the move.
+        :return: The index of the move in `rays` and `ray_indexes`.
+        """
+        return ((color * self.number_of_cells) + cell) * 4 + direction
+
+    def get_ray(self, color: int, cell: int, direction: int) -> Tuple[int, ...]:
+        """
+        Get the cells traversed by a pawn moving on an empty board.
+        :param color: The color value of the moving pawn.
+        :param cell: The cell index the pawn moves from.
+        :param direction: The direction value of the move.
+        :return: The traversed cells, in order, the starting cell excluded.
+        """
+        return self.rays[self.get_index(color, cell, direction)]
+
+    def get_destination(
+        self, color: int, cell: int, direction: int, pawns: Iterable[int]
+    ) -> int:
+        """
+        Get the cell where a pawn stops.
+        :param color: The color value of the moving pawn.
+        :param cell: The cell index the pawn moves from.
+        :param direction: The direction value of the move.
+        :param pawns: The cell indexes of the pawns on the board, the moving pawn may be included.
+        :return: The cell index where the pawn stops, `cell` if the pawn can't move.
+        """
+        index = self.get_index(color, cell, direction)
+        ray = self.rays[index]
+        ray_index = self.ray_indexes[index]
+
+        # The pawn stops before the first pawn lying on its ray
+        stop = len(ray)
+        for pawn in pawns:
+            i = ray_index.get(pawn)
+            if i is not None and i < stop:
+                stop = i
+
+        return ray[stop - 1] if stop else cell
+
+    def get_predecessors(self, color: int, cell: int, pawns: Iterable[int]) -> List[int]:
+        """
+        Get the cells from which a pawn stops on a given cell in one move (reverse move generation).
+        :param color: The color value of the moving pawn.
+        :param cell: The cell index where the pawn stops.
+        :param pawns: The cell indexes of the other pawns on the board.
+        :return: The cell indexes the pawn may have moved from.
+        """
+        if color not in self._stop_moves:
+            self._build_reverse_tables(color)
+        pawns = set(pawns)
+        predecessors = []
+
+        # Moves stopped by a wall on the cell
+        for index in self._stop_moves[color][cell]:
+            start = index // 4 - color * self.number_of_cells
+            if start in pawns:
+                continue
+            ray_index = self.ray_indexes[index]
+            if all(pawn not in ray_index for pawn in pawns):
+                predecessors.append(start)
+
+        # Moves stopped by a pawn on the next cell of the ray
+        for index, i in self._passing_moves[color][cell]:
+            ray = self.rays[index]
+            if ray[i + 1] not in pawns:
+                continue
+            start = index // 4 - color * self.number_of_cells
+            if start in pawns:
+                continue
+            ray_index = self.ray_indexes[index]
+            if all(ray_index.get(pawn, i + 1) > i for pawn in pawns):
+                predecessors.append(start)
+
+        return predecessors
+
+    def get_distance_map(self, color: int, target: int) -> List[int]:
+        """
+        Get a lower bound of the number of moves needed by a pawn to reach a target cell, from every cell.
+        The other pawns are ignored, except that they may stop the pawn anywhere along a ray:
+        the bound never overestimates the number of moves of the pawn.
+        :param color: The color value of the pawn.
+        :param target: The target cell index.
+        :return: The distance of each cell index, `UNREACHABLE` if the target can't be reached from it.
+        """
+        key = (color, target)
+        if key not in self._distance_maps:
+            self._distance_maps[key] = self._compute_distance_map(color, target)
+        return self._distance_maps[key]
+
+    def _compute_distance_map(self, color: int, target: int) -> List[int]:
+        """
+        Compute the distance map of a pawn to a target cell with a reverse breadth-first search.
+        :param color: The color value of the pawn.
+        :param target: The target cell index.
+        :return: The distance of each cell index, `UNREACHABLE` if the target can't be reached from it.
+        """
+        # Cells from which a pawn can stop on a given cell in one move
+        predecessors: List[List[int]] = [[] for _ in range(self.number_of_cells)]
+        for cell in range(self.number_of_cells):
+            for direction in range(4):
+                for ray_cell in self.get_ray(color, cell, direction):
+                    predecessors[ray_cell].append(cell)
+
+        distances = [UNREACHABLE] * self.number_of_cells
+        distances[target] = 0
+        queue = deque([target])
+        while queue:
+            cell = queue.popleft()
+            for predecessor in predecessors[cell]:
+                if distances[predecessor] == UNREACHABLE:
+                    distances[predecessor] = distances[cell] + 1
+                    queue.append(predecessor)
+        return distances
+
+    def _build_reverse_tables(self, color: int) -> None:
+        """
+        Index the moves of a color by the cells they stop on or pass through.
+        :param color: The color value of the pawn.
+        """
+        stop_moves: List[List[int]] = [[] for _ in range(self.number_of_cells)]
+        passing_moves: List[List[Tuple[int, int]]] = [
+            [] for _ in range(self.number_of_cells)
+        ]
+        for cell in range(self.number_of_cells):
+            for direction in range(4):
+                index = self.get_index(color, cell, direction)
+                ray = self.rays[index]
+                for i, ray_cell in enumerate(ray[:-1]):
+                    passing_moves[ray_cell].append((index, i))
+                if ray:
+                    stop_moves[ray[-1]].append(index)
+        self._stop_moves[color] = stop_moves
+        self._passing_moves[color] = passing_moves
+
+    def _compute_ray(
+        self, state: GameState, color: Color, cell: int, direction: Direction
+    ) -> Tuple[int, ...]:
+        """
+        Compute the cells traversed by a pawn moving on an empty board.
+        :param state: The game state holding the walls and mirrors.
+        :param color: The color of the moving pawn.
+        :param cell: The cell index the pawn moves from.
+        :param direction: The direction of the move.
+        :return: The traversed cells, in order, the starting cell excluded.
+        """
+        x, y = divmod(cell, self.board_size)
+        ray = []
+
+        # Move the pawn until it hits a wall, the mirrors of its color reflecting it to another direction
+        while not state.walls[x, y] & (1 << direction.value):
+            dx, dy = DIRECTION_DELTAS[direction.value]
+            if not (
+                0 <= x + dx < self.board_size and 0 <= y + dy < self.board_size
+            ):
+                break
+            x += dx
+            y += dy
+
+            # The pawn stays on its starting cell while moving, a ray looping back stops before it
+            next_cell = x * self.board_size + y
+            if next_cell == cell:
+                break
+            ray.append(next_cell)
+
+            mirror_color, mirror_angle = decode_mirror(state.mirrors[x, y])
+            if mirror_color == color:
+                direction = get_reflected_direction(direction, mirror_angle)
+
+        return tuple(ray)
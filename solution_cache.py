@@ -0,0 +1,166 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from utils import Color, Coordinate, Shape
+
+# Default location of the cache database
+DEFAULT_CACHE_PATH = "solutions.sqlite3"
+
+# Default maximum number of solutions kept in the cache
+DEFAULT_MAX_ENTRIES = 100_000
+
+# Fraction of the entries evicted at once when the cache is full, to avoid evicting on every insertion
+EVICTION_RATIO = 0.1
+
+
+class SolutionCache:
+    """
+    On-disk cache of the optimal solutions found by the AI player, stored in a SQLite database.
+    Solutions are keyed by a hash of the board seed, the positions of the pawns and the target.
+    Once the cache holds more than `max_entries` solutions, the least recently used ones are evicted.
+    """
+
+    def __init__(
+        self, path: str = DEFAULT_CACHE_PATH, max_entries: int = DEFAULT_MAX_ENTRIES
+    ):
+        """
+        :param path: The path of the database file, ":memory:" for a cache that is not persisted.
+        :param max_entries: The maximum number of solutions kept in the cache.
+        """
+        if max_entries < 1:
+            raise ValueError(f"The cache must hold at least one entry, got {max_entries}")
+
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS solutions (
+                key BLOB PRIMARY KEY,
+                moves TEXT NOT NULL,
+                last_used REAL NOT NULL
+            )
+            """
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS solutions_last_used ON solutions (last_used)"
+        )
+        self._connection.commit()
+        self._size = self._connection.execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
+
+    @staticmethod
+    def get_key(
+        seed: bytes, pawns: List[Coordinate], target: Tuple[Color, Shape]
+    ) -> bytes:
+        """
+        Get the key of a solution in the cache.
+        :param seed: The seed of the board.
+        :param pawns: The positions of the pawns, ordered by color.
+        :param target: The target (color, shape).
+        :return: The hash of the seed, pawns and target.
+        """
+        pawns_string = ";".join(f"{coords.x},{coords.y}" for coords in pawns)
+        target_string = f"{target[0].value},{target[1].value}"
+        return hashlib.sha256(
+            seed + f"|{pawns_string}|{target_string}".encode()
+        ).digest()
+
+    def get(
+        self, seed: bytes, pawns: List[Coordinate], target: Tuple[Color, Shape]
+    ) -> Optional[List[Tuple[Color, Coordinate]]]:
+        """
+        Get a solution from the cache.
+        :param seed: The seed of the board.
+        :param pawns: The positions of the pawns, ordered by color.
+        :param target: The target (color, shape).
+        :return: The moves of the solution, None if the solution is not in the cache.
+        """
+        key = self.get_key(seed, pawns, target)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT moves FROM solutions WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE solutions SET last_used = ? WHERE key = ?", (time.time(), key)
+            )
+            self._connection.commit()
+
+        return [
+            (Color(color), Coordinate(x=x, y=y)) for color, x, y in json.loads(row[0])
+        ]
+
+    def put(
+        self,
+        seed: bytes,
+        pawns: List[Coordinate],
+        target: Tuple[Color, Shape],
+        moves: List[Tuple[Color, Coordinate]],
+    ) -> None:
+        """
+        Store a solution in the cache, evicting the least recently used solutions if the cache is full.
+        :param seed: The seed of the board.
+        :param pawns: The positions of the pawns, ordered by color.
+        :param target: The target (color, shape).
+        :param moves: The moves of the solution.
+        """
+        key = self.get_key(seed, pawns, target)
+        serialized_moves = json.dumps(
+            [[color.value, coords.x, coords.y] for color, coords in moves]
+        )
+        with self._lock:
+            inserted = self._connection.execute(
+                "INSERT OR IGNORE INTO solutions (key, moves, last_used) VALUES (?, ?, ?)",
+                (key, serialized_moves, time.time()),
+            ).rowcount
+            if not inserted:
+                self._connection.execute(
+                    "UPDATE solutions SET moves = ?, last_used = ? WHERE key = ?",
+                    (serialized_moves, time.time(), key),
+                )
+            self._size += inserted
+
+            if self._size > self.max_entries:
+                self._evict()
+            self._connection.commit()
+
+    def clear(self) -> None:
+        """
+        Remove all the solutions from the cache.
+        """
+        with self._lock:
+            self._connection.execute("DELETE FROM solutions")
+            self._connection.commit()
+            self._size = 0
+
+    def close(self) -> None:
+        """
+        Close the database.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self):
+        return self._size
+
+    def _evict(self) -> None:
+        """
+        Evict the least recently used solutions, leaving room for new solutions.
+        Must be called with the lock held.
+        """
+        target_size = int(self.max_entries * (1 - EVICTION_RATIO))
+        self._connection.execute(
+            """
+            DELETE FROM solutions WHERE key IN (
+                SELECT key FROM solutions ORDER BY last_used LIMIT ?
+            )
+            """,
+            (self._size - target_size,),
+        )
+        self._size = target_size
@@ -1,4 +1,4 @@
-from typing import List, Tuple, Optional
+from typing import Iterator, List, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
 
@@ -46,6 +46,138 @@ class MirrorAngle(Enum):
         return self.name.lower()
 
 
+# Value of the cells of a chips or mirrors grid with no chip or mirror
+EMPTY_CELL = 0xFF
+
+# Bit of each wall side of a cell in a walls grid, the bit of a direction being `1 << direction.value`
+WALL_UP = 1
+WALL_RIGHT = 2
+WALL_DOWN = 4
+WALL_LEFT = 8
+
+
+class Grid:
+    """
+    A square grid of small integers (0 to 255), stored in a flat bytearray.
+
+    Cells are accessed with `grid[x, y]`, the data being stored at the index `x * size + y`
+    (the cell index used by `StateCodec`), so the data can also be indexed by cell index.
+    A transposed view, accessed with `grid.transposed()`, shares the data of the grid.
+
+    The game uses three kinds of grids:
+    - walls: a bitmask of the walls of each cell (`WALL_UP`, `WALL_RIGHT`, `WALL_DOWN`, `WALL_LEFT`),
+    - chips: `encode_chip(color, shape)`, or `EMPTY_CELL`,
+    - mirrors: `encode_mirror(color, angle)`, or `EMPTY_CELL`.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        fill: int = 0,
+        data: Optional[bytearray] = None,
+        transposed: bool = False,
+    ):
+        """
+        :param size: The size of the grid. (`size` x `size`)
+        :param fill: The initial value of the cells, if no data is given.
+        :param data: The data of the grid, shared with the grid.
+        :param transposed: Whether the grid is a transposed view of the data.
+        """
+        self.size = size
+        self.data = data if data is not None else bytearray([fill]) * (size * size)
+        self.is_transposed = transposed
+
+    def _get_index(self, coords: Tuple[int, int]) -> int:
+        """
+        Get the index in the data of a cell.
+        :param coords: The (x, y) coordinates of the cell.
+        :return: The index of the cell in `data`.
+        """
+        x, y = coords
+        if not (0 <= x < self.size and 0 <= y < self.size):
+            raise IndexError(f"Cell ({x}, {y}) out of the grid of size {self.size}")
+        return y * self.size + x if self.is_transposed else x * self.size + y
+
+    def __getitem__(self, coords: Tuple[int, int]) -> int:
+        return self.data[self._get_index(coords)]
+
+    def __setitem__(self, coords: Tuple[int, int], value: int):
+        self.data[self._get_index(coords)] = value
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, Grid)
+            and self.size == other.size
+            and all(value == other[x, y] for x, y, value in self.items())
+        )
+
+    def transposed(self) -> "Grid":
+        """
+        Get a transposed view of the grid, sharing its data: `grid.transposed()[x, y] == grid[y, x]`.
+        :return: The transposed view.
+        """
+        return Grid(self.size, data=self.data, transposed=not self.is_transposed)
+
+    def copy(self) -> "Grid":
+        """
+        Get a copy of the grid, not sharing its data.
+        :return: The copy.
+        """
+        return Grid(self.size, data=bytearray(self.data), transposed=self.is_transposed)
+
+    def to_bytes(self) -> bytes:
+        """
+        Get the values of the cells, ordered by cell index `x * size + y`.
+        :return: The values of the cells.
+        """
+        if not self.is_transposed:
+            return bytes(self.data)
+        return bytes(self[x, y] for x in range(self.size) for y in range(self.size))
+
+    def items(self) -> Iterator[Tuple[int, int, int]]:
+        """
+        Iterate over the cells of the grid.
+        :return: An iterator of (x, y, value).
+        """
+        for x in range(self.size):
+            for y in range(self.size):
+                yield x, y, self[x, y]
+
+
+def encode_chip(color: Color, shape: Shape) -> int:
+    """
+    Encode a chip as a cell value of a chips grid.
+    """
+    return (color.value << 4) | shape.value
+
+
+def decode_chip(value: int) -> Tuple[Optional[Color], Optional[Shape]]:
+    """
+    Decode a cell value of a chips grid.
+    :return: The (color, shape) of the chip, (None, None) if the cell has no chip.
+    """
+    if value == EMPTY_CELL:
+        return None, None
+    return Color(value >> 4), Shape(value & 0xF)
+
+
+def encode_mirror(color: Color, angle: MirrorAngle) -> int:
+    """
+    Encode a mirror as a cell value of a mirrors grid.
+    """
+    return (color.value << 4) | (angle == MirrorAngle.SLASH)
+
+
+def decode_mirror(value: int) -> Tuple[Optional[Color], Optional[MirrorAngle]]:
+    """
+    Decode a cell value of a mirrors grid.
+    :return: The (color, angle) of the mirror, (None, None) if the cell has no mirror.
+    """
+    if value == EMPTY_CELL:
+        return None, None
+    return Color(value >> 4), MirrorAngle.SLASH if value & 1 else MirrorAngle.BACKSLASH
+
+
 @dataclass
 class GameState:
     board_size: int
@@ -53,25 +185,25 @@ class GameState:
     The size of the grid of the game board. (`board_size` x `board_size`)
     """
 
-    walls: List[List[Tuple[bool, bool, bool, bool]]]
+    walls: Grid
     """
-    A grid representing each cell of the game board. Each cell has a tuple of 4 booleans representing the walls
-    in the following order: (up, right, down, left).
-    The grid must have the size of `board_size` x `board_size` and a cell in the grid must be accessible by `walls[x][y]`.
+    A grid holding the walls of each cell of the game board as a bitmask of
+    `WALL_UP`, `WALL_RIGHT`, `WALL_DOWN` and `WALL_LEFT`.
+    The grid must have the size of `board_size` x `board_size`, a cell being accessible by `walls[x, y]`.
     """
 
-    mirrors: List[List[Tuple[Optional[Color], Optional[MirrorAngle]]]]
+    mirrors: Grid
     """
-    A grid representing each cell of the game board.
-    The grid must have the size of `board_size` x `board_size` and a cell in the grid must be accessible by `mirrors[x][y]`.
-    If the cell has no mirror, the tuple is (None, None).
+    A grid holding the mirror of each cell of the game board (see `decode_mirror`).
+    The grid must have the size of `board_size` x `board_size`, a cell being accessible by `mirrors[x, y]`.
+    If the cell has no mirror, the value is `EMPTY_CELL`.
     """
 
-    chips: List[List[Tuple[Optional[Color], Optional[Shape]]]]
+    chips: Grid
     """
-    A grid representing each cell of the game board.
-    The grid must have the size of `board_size` x `board_size` and a cell in the grid must be accessible by `chips[x][y]`.
-    If the cell has no chip, the tuple is (None, None).
+    A grid holding the chip of each cell of the game board (see `decode_chip`).
+    The grid must have the size of `board_size` x `board_size`, a cell being accessible by `chips[x, y]`.
+    If the cell has no chip, the value is `EMPTY_CELL`.
     """
 
     pawns: List[Coordinate]
@@ -89,9 +221,9 @@ class GameState:
     ```
     """
 
-    current_target: Tuple[Color, Shape]
+    current_target: Optional[Tuple[Color, Shape]]
     """
-    The current target of the game.
+    The current target of the game, None if no target is selected.
     """
 
 
@@ -100,3 +232,84 @@ class Direction(Enum):
     RIGHT = 1
     DOWN = 2
     LEFT = 3
+
+
+class StateCodec:
+    """
+    Pack the positions of all the pawns into a single integer.
+    Each pawn uses `cell_bits` bits storing the index `x * board_size + y` of its cell,
+    the pawn of color `i` being stored at the bits `[i * cell_bits, (i + 1) * cell_bits)`.
+    On the default 16x16 board, each pawn uses 8 bits.
+    """
+
+    def __init__(self, board_size: int, number_of_pawns: int):
+        self.board_size = board_size
+        self.number_of_pawns = number_of_pawns
+        self.cell_bits = max(1, (board_size * board_size - 1).bit_length())
+        self.cell_mask = (1 << self.cell_bits) - 1
+
+    def encode_cell(self, coords: Coordinate) -> int:
+        """
+        Get the index of a cell.
+        :param coords: The coordinates of the cell.
+        :return: The index of the cell.
+        """
+        return coords.x * self.board_size + coords.y
+
+    def decode_cell(self, cell: int) -> Coordinate:
+        """
+        Get the coordinates of a cell from its index.
+        :param cell: The index of the cell.
+        :return: The coordinates of the cell.
+        """
+        return Coordinate(x=cell // self.board_size, y=cell % self.board_size)
+
+    def encode(self, pawns: List[Coordinate]) -> int:
+        """
+        Pack the positions of the pawns.
+        :param pawns: The positions of the pawns, ordered by color.
+        :return: The packed state.
+        """
+        state = 0
+        for i, coords in enumerate(pawns):
+            state |= self.encode_cell(coords) << (i * self.cell_bits)
+        return state
+
+    def decode(self, state: int) -> List[Coordinate]:
+        """
+        Unpack the positions of the pawns.
+        :param state: The packed state.
+        :return: The positions of the pawns, ordered by color.
+        """
+        return [self.decode_cell(cell) for cell in self.get_cells(state)]
+
+    def get_cells(self, state: int) -> List[int]:
+        """
+        Get the cell index of every pawn.
+        :param state: The packed state.
+        :return: The cell indexes, ordered by color.
+        """
+        return [
+            (state >> (i * self.cell_bits)) & self.cell_mask
+            for i in range(self.number_of_pawns)
+        ]
+
+    def get_cell(self, state: int, pawn: int) -> int:
+        """
+        Get the cell index of a pawn.
+        :param state: The packed state.
+        :param pawn: The index (color value) of the pawn.
+        :return: The cell index of the pawn.
+        """
+        return (state >> (pawn * self.cell_bits)) & self.cell_mask
+
+    def set_cell(self, state: int, pawn: int, cell: int) -> int:
+        """
+        Move a pawn to another cell.
+        :param state: The packed state.
+        :param pawn: The index (color value) of the pawn.
+        :param cell: The new cell index of the pawn.
+        :return: The new packed state.
+        """
+        shift = pawn * self.cell_bits
+        return (state & ~(self.cell_mask << shift)) | (cell << shift)